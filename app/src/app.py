@@ -3,7 +3,6 @@ import argparse
 import customtkinter as ctk
 from auth import AuthClient
 from login_window import LoginWindow
-from main_window import MainWindow
 from logger import setup_logging
 import logging
 import sys
@@ -51,6 +50,10 @@ def start_app():
     # Login callback
     # -----------------------------
     def on_login_success(user):
+        # Deferred: pulls in websocket-client, aiortc and OpenCV, none of
+        # which are needed to draw the login window.
+        from main_window import MainWindow
+
         username = user.get("username", "unknown")
         logging.info("User logged in: %s", username)
         MainWindow(root, user, auth)
@@ -1,69 +1,125 @@
 # auth.py
-import os
-from dotenv import load_dotenv
+import ssl
+from urllib.parse import urlsplit, urlunsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import API_PORT
 import logging
 logger = logging.getLogger(__name__)
 
 
-APP_DIR = os.path.dirname(os.path.abspath(__file__))
-BASE_DIR = os.path.abspath(os.path.join(APP_DIR, "..", ".."))
-ENV_PATH = os.path.join(BASE_DIR, ".env.development")
-load_dotenv(ENV_PATH)
+class _TLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that hands one prebuilt SSLContext to every pooled connection,
+    instead of urllib3 building a fresh context per connection.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
 
 class AuthClient:
     """
     Auth HTTP client wrapping requests.Session.
     - Preserves cookies (requests.Session)
     - By default verifies TLS (requests.Session.verify = True)
+    - Keeps connections alive so login/me/logout share one TLS handshake
     """
 
     ACCESS_TOKEN_COOKIE_NAME = "accessToken"
 
     def __init__(self, base_url: str = None):
-        api_port = os.getenv("SPRING_PORT")
-        #api_host = os.getenv("PUBLIC_HOST")
         if (base_url is None) or (base_url == ""):
-            base_url = f"https://localhost:{api_port}/api"
+            base_url = f"https://localhost:{API_PORT}/api"
         self.base_url = base_url.rstrip("/")
+
+        # WebSocket endpoint lives next to the REST API: https://host/api -> wss://host/ws
+        parts = urlsplit(self.base_url)
+        path = parts.path[:-4] if parts.path.endswith("/api") else parts.path
+        self.ws_url = urlunsplit(("wss", parts.netloc, f"{path}/ws", "", ""))
+
         self.session = requests.Session()
 
+        # verify=False below: no trust store is needed, so skip create_default_context()
+        self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        self.ssl_context.check_hostname = False
+        self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        adapter = _TLSAdapter(
+            self.ssl_context,
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+
         self.session.verify = False
         self.session.trust_env = False
 
+        # Cookie header for the WebSocket handshake; reset whenever a request may change the jar
+        self._cookie_header_cache: str | None = None
+        # User info returned by /auth/login; saves the /auth/me round-trip right after login
+        self._current_user: dict | None = None
+
     def _url(self, path: str) -> str:
         return f"{self.base_url}{path}"
 
     def login(self, username: str, password: str) -> bool:
         """
-        Perform login. Expects backend to set secure HTTP-only cookie 'accessToken'.
+        Perform login. Expects backend to set secure HTTP-only cookie 'accessToken'
+        and to return the user info in the response body.
         Returns True on success.
         """
         url = self._url("/auth/login")
+        self._cookie_header_cache = None
+        self._current_user = None
         resp = self.session.post(url, json={"username": username, "password": password})
         if resp.status_code != 200:
-            try:
-                msg = resp.json().get("message", "Login failed")
-            except Exception as e:
-                logger.error("[AUTH ERROR - LOGIN] %s", e)
-                msg = f"Login failed (status {resp.status_code})"
-            raise Exception(msg)
+            raise Exception(self._login_error(resp))
 
         # after successful login, cookie should be set in session.cookies
-        if not self.get_access_token():
-            # There's a chance backend returns token in Authorization header instead of cookie.
-            # Try to read 'Authorization' header in response and set cookie accordingly (fallback).
-            auth_header = resp.headers.get("Authorization")
-            if auth_header and auth_header.startswith("Bearer "):
-                token = auth_header.split(" ", 1)[1].strip()
-                # set cookie in session
-                self.session.cookies.set(self.ACCESS_TOKEN_COOKIE_NAME, token, path="/", secure=True, httponly=True)
-            else:
-                # If no cookie/token present — treat as error
-                raise Exception("Login succeeded but no access token cookie was set")
+        if not (self.get_access_token() or self._fallback_token(resp)):
+            # If no cookie/token present — treat as error
+            raise Exception("Login succeeded but no access token cookie was set")
+
+        # older backends answer with an empty body; get_current_user then falls back to /auth/me
+        try:
+            self._current_user = resp.json() if resp.content else None
+        except ValueError:
+            self._current_user = None
 
         return True
 
+    def _login_error(self, resp) -> str:
+        """
+        Build the error message for a rejected login from the response body.
+        """
+        try:
+            return resp.json().get("message", "Login failed")
+        except Exception as e:
+            logger.error("[AUTH ERROR - LOGIN] %s", e)
+            return f"Login failed (status {resp.status_code})"
+
+    def _fallback_token(self, resp) -> str | None:
+        """
+        There's a chance backend returns token in Authorization header instead of cookie.
+        Read 'Authorization' header from the response and set the cookie accordingly.
+        """
+        auth_header = resp.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return None
+        token = auth_header.split(" ", 1)[1].strip()
+        self.session.cookies.set(self.ACCESS_TOKEN_COOKIE_NAME, token, path="/", secure=True, httponly=True)
+        return token
+
     def logout(self) -> bool:
         """
         Logout endpoint call (if available) and clear cookie locally.
@@ -76,13 +132,20 @@ class AuthClient:
             pass
         # clear local cookie
         self.session.cookies.pop(self.ACCESS_TOKEN_COOKIE_NAME, None)
+        self._cookie_header_cache = None
+        self._current_user = None
         return True
 
-    def get_current_user(self):
+    def get_current_user(self, refresh: bool = False):
         """
-        Fetch current user info from /auth/me
+        Return current user info. Uses the copy returned by login unless
+        refresh is set; otherwise fetches it from /auth/me
         """
+        if self._current_user is not None and not refresh:
+            return self._current_user
+
         url = self._url("/auth/me")
+        self._cookie_header_cache = None
         resp = self.session.get(url)
         if resp.status_code != 200:
             try:
@@ -91,7 +154,8 @@ class AuthClient:
                 logger.error("[AUTH ERROR - GET CURRENT USER] %s", e)
                 msg = "Cannot fetch user"
             raise Exception(msg)
-        return resp.json()
+        self._current_user = resp.json()
+        return self._current_user
 
     def get_access_token(self) -> str | None:
         """
@@ -104,9 +168,9 @@ class AuthClient:
         Build Cookie header string from session cookies for use in WebSocket handshake:
         e.g. "accessToken=xxx; other=yyy"
         """
-        jar = self.session.cookies
-        cookie_header = "; ".join([f"{c.name}={c.value}" for c in jar])
-        return cookie_header
+        if self._cookie_header_cache is None:
+            self._cookie_header_cache = "; ".join(f"{c.name}={c.value}" for c in self.session.cookies)
+        return self._cookie_header_cache
 
     def session_obj(self) -> requests.Session:
         return self.session
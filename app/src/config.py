@@ -0,0 +1,29 @@
+# config.py
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+
+APP_DIR = Path(__file__).resolve().parent
+BASE_DIR = APP_DIR.parents[1]
+ENV_PATH = BASE_DIR / ".env.development"
+
+
+def load_env():
+    """
+    Load ENV_PATH into os.environ. Runs once, when this module is first imported.
+    """
+    load_dotenv(ENV_PATH)
+
+
+load_env()
+
+API_HOST = os.getenv("PUBLIC_IP")
+API_PORT = os.getenv("SPRING_PORT")
+FRONTEND_PORT = os.getenv("FRONTEND_PORT")
+TURN_PORT = os.getenv("TURN_PORT")
+TURN_USERNAME = os.getenv("TURN_USERNAME")
+TURN_PASSWORD = os.getenv("TURN_PASSWORD")
+STUN_URL = os.getenv("STUN_URL")
+# "1"/"true"/"yes": WebRTC receiver skips the jitter-buffer prefetch (lower delay, more visible loss)
+LOW_LATENCY = os.getenv("LOW_LATENCY", "").strip().lower() in ("1", "true", "yes")
@@ -1,11 +1,25 @@
 # logger.py
+import atexit
 import logging
+import queue
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 import sys
 
+_listener: QueueListener | None = None
+
+def _stop_listener():
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def setup_logging(debug=False):
+    global _listener
+
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
@@ -19,6 +33,9 @@ def setup_logging(debug=False):
     # Remove any previously added handlers (important for PyInstaller)
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_listener()
+
+    handlers = []
 
     # ------------------------
     # FILE HANDLER (always on)
@@ -27,12 +44,13 @@ def setup_logging(debug=False):
         log_file,
         maxBytes=5 * 1024 * 1024,  # 5 MB
         backupCount=5,
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True  # file is opened on the first record
     )
     file_handler.setFormatter(logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     ))
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
 
     # ------------------------
     # CONSOLE (only in debug)
@@ -44,6 +62,14 @@ def setup_logging(debug=False):
         console.setFormatter(logging.Formatter(
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
         ))
-        logger.addHandler(console)
+        handlers.append(console)
+
+    # ------------------------
+    # QUEUE (disk/console I/O runs on the listener thread)
+    # ------------------------
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     logger.info("Logger initialized (debug=%s)", debug)
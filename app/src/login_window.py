@@ -1,10 +1,16 @@
 #login_window.py
 import customtkinter as ctk
+import queue
+import threading
 import logging
 from popup import Popup
+from ui_utils import grab_focus
 logger = logging.getLogger(__name__)
 
 class LoginWindow(ctk.CTkToplevel):
+    # how often (ms) the Tk thread checks for the login worker's result
+    LOGIN_POLL_MS = 50
+
     def __init__(self, parent, auth_client, on_success):
         super().__init__(parent)
 
@@ -37,16 +43,16 @@ class LoginWindow(ctk.CTkToplevel):
         self.show_btn = ctk.CTkButton(self, text="👁 Show", width=90, command=self.toggle_pass)
         self.show_btn.pack()
 
-        ctk.CTkButton(self, text="Login", width=160, command=self.try_login).pack(pady=25)
+        self.login_btn = ctk.CTkButton(self, text="Login", width=160, command=self.try_login)
+        self.login_btn.pack(pady=25)
 
         # Block background & focus
-        self.grab_set()
-        self.focus_force()
+        self.after_idle(grab_focus, self)
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def center(self):
-        self.update_idletasks()
+        # fixed size + screen metrics only; no need to flush pending geometry first
         w, h = 420, 320
         sw = self.winfo_screenwidth()
         sh = self.winfo_screenheight()
@@ -63,20 +69,51 @@ class LoginWindow(ctk.CTkToplevel):
             self.show_btn.configure(text="👁 Show")
 
     def try_login(self):
+        # HTTP round-trips run on a worker so the window stays responsive
+        self.login_btn.configure(state="disabled")
+        result_q = queue.SimpleQueue()
+        threading.Thread(
+            target=self._login_worker,
+            args=(self.username.get(), self.password.get(), result_q),
+            daemon=True
+        ).start()
+        self.after(self.LOGIN_POLL_MS, self._poll_login, result_q)
+
+    def _login_worker(self, username, password, result_q):
+        # off the Tk thread: no Tcl calls here, the result is picked up by _poll_login
         try:
-            self.auth.login(self.username.get(), self.password.get())
+            self.auth.login(username, password)
             user = self.auth.get_current_user()
+        except Exception as e:
+            result_q.put((False, str(e)))
+            return
+        result_q.put((True, user))
 
-            if "RECEIVER" not in user.get("roles", []):
-                Popup.error(self, "Access denied (RECEIVER role required)")
-                return
+    def _poll_login(self, result_q):
+        if not self.winfo_exists():
+            return
+        try:
+            ok, value = result_q.get_nowait()
+        except queue.Empty:
+            self.after(self.LOGIN_POLL_MS, self._poll_login, result_q)
+            return
+        if ok:
+            self._on_login_done(value)
+        else:
+            self._on_login_error(value)
 
-            # close window -> then run success callback
-            self.destroy()
-            self.on_success(user)
+    def _on_login_done(self, user):
+        if "RECEIVER" not in user.get("roles", []):
+            self._on_login_error("Access denied (RECEIVER role required)")
+            return
 
-        except Exception as e:
-            Popup.error(self, str(e))
+        # close window -> then run success callback
+        self.destroy()
+        self.on_success(user)
+
+    def _on_login_error(self, message):
+        self.login_btn.configure(state="normal")
+        Popup.error(self, message)
 
     def on_close(self):
         try:
@@ -1,13 +1,34 @@
 # main_window.py
+import functools
 import json
+import queue
 import customtkinter as ctk
 from popup import Popup
-from websocket_client import WebSocketClient
+from ui_utils import grab_focus
 from webrtc_receiver import WebRTCReceiver
+from config import LOW_LATENCY
 import logging
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # optional C-extension JSON codec
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    # Shared per (size, weight); needs an existing Tk root, so only call from widget code
+    return ctk.CTkFont(size=size, weight=weight)
+
 class MainWindow(ctk.CTkToplevel):
+    WS_POLL_MS = 10
+    WS_DRAIN_MAX = 100
+
     def __init__(self, parent, user_info, auth_client):
         super().__init__(parent)
 
@@ -21,6 +42,12 @@ class MainWindow(ctk.CTkToplevel):
         # store last received payload
         self.last_received_payload = None
 
+        # WS thread -> Tk thread handoff, drained on a fixed tick
+        self._ws_queue = queue.Queue()
+
+        # answers only differ in "to" and "payload"; the rest of the SignalingMessage is fixed
+        self._answer_prefix = '{"type":"answer","from":%s,' % _json_dumps(user_info.get("username"))
+
         # ----------------------
         # STATUS VARIABLES
         # ----------------------
@@ -33,44 +60,47 @@ class MainWindow(ctk.CTkToplevel):
         # ----------------------
         self.webrtc = WebRTCReceiver(
             on_stream_start=self._on_stream_start,
-            on_stream_stop=self._on_stream_stop
+            on_stream_stop=self._on_stream_stop,
+            low_latency=LOW_LATENCY
         )
 
         # ----------------------
         # UI SETUP
         # ----------------------
-        ctk.CTkLabel(self, text="WS Status:", font=ctk.CTkFont(size=16)).pack(pady=(20, 5))
+        ctk.CTkLabel(self, text="WS Status:", font=_font(16)).pack(pady=(20, 5))
         self.status_label = ctk.CTkLabel(
             self,
             textvariable=self.status_var,
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         self.status_label.pack(pady=5)
 
-        ctk.CTkLabel(self, text="Connected Users:", font=ctk.CTkFont(size=18)).pack(pady=(30, 5))
+        ctk.CTkLabel(self, text="Connected Users:", font=_font(18)).pack(pady=(30, 5))
         self.connected_label = ctk.CTkLabel(
             self,
             textvariable=self.connected_users_var,
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color="#00bfff"
         )
         self.connected_label.pack(pady=10)
 
         # STREAM STATUS LABEL
-        ctk.CTkLabel(self, text="Stream Status:", font=ctk.CTkFont(size=18)).pack(pady=(30, 5))
+        ctk.CTkLabel(self, text="Stream Status:", font=_font(18)).pack(pady=(30, 5))
         self.stream_label = ctk.CTkLabel(
             self,
             textvariable=self.stream_status_var,
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=_font(26, "bold"),
             text_color="#aaaaaa"
         )
         self.stream_label.pack(pady=10)
 
-        ctk.CTkLabel(self, text="Audio Level:", font=ctk.CTkFont(size=18)).pack(pady=(10, 5))
+        ctk.CTkLabel(self, text="Audio Level:", font=_font(18)).pack(pady=(10, 5))
         self.audio_slider = ctk.CTkSlider(self, from_=0, to=1, number_of_steps=100)
         self.audio_slider.pack(pady=5)
         self.audio_slider.set(0)
         self.audio_slider.configure(state="disabled")
+        self._audio_meter_active = False
+        self._audio_meter_level = 0.0
 
         # BUTTONS FRAME
         frame = ctk.CTkFrame(self)
@@ -97,10 +127,10 @@ class MainWindow(ctk.CTkToplevel):
         self._update_buttons(False)
 
         self.user_list = []
-        self.grab_set()
-        self.focus_force()
+        self.after_idle(grab_focus, self)
 
         self._update_audio_meter()
+        self.after(self.WS_POLL_MS, self._drain_ws)
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -123,15 +153,23 @@ class MainWindow(ctk.CTkToplevel):
     # STREAM STATE HANDLING
     # --------------------------
 
+    # called from the aiortc loop thread; widgets are only touched in _drain_ws
+
     def _on_stream_start(self):
-        self.stream_status_var.set("STREAM ACTIVE")
-        self.stream_label.configure(text_color="#00ff00")
-        self.preview_btn.configure(state="normal")
+        self._ws_queue.put(("stream", True))
 
     def _on_stream_stop(self):
-        self.stream_status_var.set("STREAM INACTIVE")
-        self.stream_label.configure(text_color="#aaaaaa")
-        self.preview_btn.configure(state="disabled")
+        self._ws_queue.put(("stream", False))
+
+    def _apply_stream_state(self, active: bool):
+        if active:
+            self.stream_status_var.set("STREAM ACTIVE")
+            self.stream_label.configure(text_color="#00ff00")
+            self.preview_btn.configure(state="normal")
+        else:
+            self.stream_status_var.set("STREAM INACTIVE")
+            self.stream_label.configure(text_color="#aaaaaa")
+            self.preview_btn.configure(state="disabled")
 
     # --------------------------
     # STREAM PREVIEW BUTTON
@@ -162,17 +200,15 @@ class MainWindow(ctk.CTkToplevel):
     # --------------------------
 
     def connect_ws(self):
+        from websocket_client import WebSocketClient
+
         try:
             token = self.auth.get_access_token()
             if not token:
                 Popup.error(self, "No authorization token — log in again")
                 return
 
-            base = self.auth.base_url.replace("https://", "").replace("http://", "")
-            if base.endswith("/api"):
-                base = base[:-4]
-
-            ws_url = f"wss://{base}/ws"
+            ws_url = self.auth.ws_url
             cookie_header = self.auth.get_cookie_header()
             verify_tls = getattr(self.auth.session, "verify", True)
 
@@ -181,7 +217,8 @@ class MainWindow(ctk.CTkToplevel):
                 cookie_header=cookie_header,
                 on_message=self._on_ws_message,
                 on_status=self._on_ws_status,
-                verify_tls=verify_tls
+                verify_tls=verify_tls,
+                ssl_context=self.auth.ssl_context if not verify_tls else None
             )
             self.ws_client.connect()
             self._update_buttons(True)
@@ -208,9 +245,9 @@ class MainWindow(ctk.CTkToplevel):
     # WS MESSAGE HANDLING
     # --------------------------
 
-    def _on_ws_message(self, message: str):
+    def _on_ws_message(self, message: bytes):
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
         except Exception as e:
             logging.error("[MAIN WINDOW - ON MESSAGE] %s", e)
             return
@@ -222,57 +259,101 @@ class MainWindow(ctk.CTkToplevel):
             self.last_received_payload = data["payload"]
 
         if msg_type == "user-list":
+            # label text is built here on the WS thread; Tk only assigns it
             users = data.get("payload", [])
-            self.after(0, lambda: self._update_user_list(users))
+            self._ws_queue.put(("users", (users, self._format_users(users))))
 
         elif msg_type == "offer":
             # payload is JSON-string; parse to object
-            payload = json.loads(data.get("payload", "{}"))
+            payload = self._payload_obj(data)
             # pass offer to webrtc receiver; callback will send answer back via websocket
             self.webrtc.receive_offer(payload, lambda ans: self._send_answer(ans, data))
 
         elif msg_type == "candidate":
-            payload = json.loads(data.get("payload", "{}"))
+            payload = self._payload_obj(data)
             self.webrtc.add_candidate(payload)
 
+    @staticmethod
+    def _payload_obj(data: dict):
+        # SignalingMessage.payload is normally a JSON string; only parse it in that case
+        payload = data.get("payload", "{}")
+        if isinstance(payload, (str, bytes)):
+            return _json_loads(payload)
+        return payload
+
     def _send_answer(self, answer_obj, request):
         if not self.ws_client:
             return
 
-        response = {
-            "type": "answer",
-            "from": self.user_info.get("username"),
-            "to": request.get("from"),
-            "payload": json.dumps(answer_obj)
-        }
-        self.ws_client.send(json.dumps(response))
+        response = '%s"to":%s,"payload":%s}' % (
+            self._answer_prefix,
+            _json_dumps(request.get("from")),
+            _json_dumps(_json_dumps(answer_obj))
+        )
+        self.ws_client.send(response)
 
     # --------------------------
     # WS STATUS HANDLING
     # --------------------------
 
     def _on_ws_status(self, status: str):
-        self.after(0, lambda: self._set_status(status))
+        self._ws_queue.put(("status", status))
+
+        if status.upper() != "CONNECTED":
+            self.webrtc.stop_stream()
+
+    def _apply_ws_status(self, status: str):
+        self._set_status(status)
 
         if status.upper() == "CONNECTED":
-            self.after(0, lambda: self._update_buttons(True))
+            self._update_buttons(True)
         else:
-            self.after(0, lambda: self._update_buttons(False))
-            self.after(0, self._clear_users)
-            self.webrtc.stop_stream()
+            self._update_buttons(False)
+            self._clear_users()
+
+    def _drain_ws(self):
+        """
+        Applies queued WS/stream events on the Tk thread in one pass.
+        Consecutive user lists collapse to the newest one; other events keep their order.
+        """
+        users = None
+        try:
+            for _ in range(self.WS_DRAIN_MAX):
+                try:
+                    kind, value = self._ws_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "users":
+                    users = value
+                    continue
+                if users is not None:
+                    self._update_user_list(*users)
+                    users = None
+                if kind == "status":
+                    self._apply_ws_status(value)
+                else:
+                    self._apply_stream_state(value)
+            if users is not None:
+                self._update_user_list(*users)
+        except Exception as e:
+            logging.error("[MAIN WINDOW - DRAIN WS] %s", e)
+        finally:
+            # rescheduled even after an error, otherwise later events would pile up unapplied
+            self.after(self.WS_POLL_MS, self._drain_ws)
 
     # --------------------------
     # USERS LIST
     # --------------------------
 
-    def _update_user_list(self, users: list[str]):
-        self.user_list = users
-
+    @staticmethod
+    def _format_users(users: list[str]) -> str:
         if not users:
-            self.connected_users_var.set("No connected users")
-        else:
-            formatted = " • ".join(users)
-            self.connected_users_var.set(formatted)
+            return "No connected users"
+        return " • ".join(users)
+
+    def _update_user_list(self, users: list[str], formatted: str):
+        self.user_list = users
+        self.connected_users_var.set(formatted)
 
     def _clear_users(self):
         self.user_list = []
@@ -285,15 +366,19 @@ class MainWindow(ctk.CTkToplevel):
     def _update_audio_meter(self):
         """
         Periodically reads audio level from WebRTCReceiver and updates slider.
+        The slider is only reconfigured when its state or value changes.
         """
         try:
-            if self.webrtc.has_stream:
-                self.audio_slider.configure(state="normal")
-                level = getattr(self.webrtc, "audio_level", 0.0)
+            active = self.webrtc.has_stream
+            level = getattr(self.webrtc, "audio_level", 0.0) if active else 0.0
+
+            if active != self._audio_meter_active:
+                self._audio_meter_active = active
+                self.audio_slider.configure(state="normal" if active else "disabled")
+
+            if level != self._audio_meter_level:
+                self._audio_meter_level = level
                 self.audio_slider.set(level)
-            else:
-                self.audio_slider.set(0)
-                self.audio_slider.configure(state="disabled")
         except Exception as e:
             logging.error("[MAIN WINDOW - AUDIO METER] %s", e)
             pass
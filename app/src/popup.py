@@ -2,25 +2,46 @@
 import customtkinter as ctk
 
 class Popup:
+    # one reusable popup per parent window, cached on the parent as parent._popup so it
+    # goes away with it; hidden on OK instead of destroyed
+
     @staticmethod
-    def _show(parent, title, message, color):
+    def _build(parent):
         win = ctk.CTkToplevel(parent)
-        win.title(title)
         win.geometry("300x160")
         win.resizable(False, False)
+        win.transient(parent)
+
+        win.label = ctk.CTkLabel(win, text="", wraplength=250)
+        win.label.pack(pady=20)
+        ctk.CTkButton(win, text="OK", command=lambda: Popup._hide(win)).pack(pady=10)
+        win.protocol("WM_DELETE_WINDOW", lambda: Popup._hide(win))
+        return win
+
+    @staticmethod
+    def _hide(win):
+        win.grab_release()
+        win.withdraw()
+
+    @staticmethod
+    def _show(parent, title, message, color):
+        win = getattr(parent, "_popup", None)
+        if win is None or not win.winfo_exists():
+            win = Popup._build(parent)
+            parent._popup = win
+
+        win.title(title)
+        win.label.configure(text=message, text_color=color)
 
         parent.update_idletasks()
         x = parent.winfo_x() + 50
         y = parent.winfo_y() + 50
         win.geometry(f"+{x}+{y}")
 
-        win.transient(parent)
+        win.deiconify()
         win.grab_set()
         win.focus_force()
 
-        ctk.CTkLabel(win, text=message, text_color=color, wraplength=250).pack(pady=20)
-        ctk.CTkButton(win, text="OK", command=win.destroy).pack(pady=10)
-
     @staticmethod
     def error(parent, message):
         Popup._show(parent, "Error", message, "red")
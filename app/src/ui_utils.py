@@ -0,0 +1,27 @@
+# ui_utils.py
+from tkinter import TclError
+import logging
+logger = logging.getLogger(__name__)
+
+# grab_set is retried this often (ms) while the window isn't mapped yet, at most GRAB_RETRIES times (~1 s)
+GRAB_RETRY_MS = 20
+GRAB_RETRIES = 50
+
+
+def grab_focus(win, retries: int = GRAB_RETRIES):
+    """
+    Makes win modal and focused. Call it via after_idle: grab_set needs a mapped window,
+    so it is retried only while the window manager hasn't mapped win yet.
+    """
+    if not win.winfo_exists():
+        return
+    try:
+        win.grab_set()
+    except TclError as e:
+        if retries > 0 and not win.winfo_viewable():
+            win.after(GRAB_RETRY_MS, grab_focus, win, retries - 1)
+        else:
+            # mapped but still failing (e.g. another window holds the grab): stay non-modal
+            logger.warning("[UI - GRAB FOCUS] %s", e)
+        return
+    win.focus_force()
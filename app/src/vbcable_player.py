@@ -8,6 +8,9 @@ logger = logging.getLogger(__name__)
 
 
 class VBCablePlayer:
+    # ring capacity in blocks (rounded up to a power of two in bytes): ~340 ms at 960 frames/48 kHz
+    RING_BLOCKS = 16
+
     def __init__(self,
                  device_name_substr: str = "CABLE Input",
                  samplerate: int = 48000,
@@ -19,10 +22,19 @@ class VBCablePlayer:
         self.channels = channels
         self.dtype = dtype
         self.frames_per_buffer = frames_per_buffer
+        self._bytes_per_frame = channels * np.dtype(dtype).itemsize
+        # zero block for underflow padding; sliced instead of allocating b'\x00' * n per callback
+        self._silence = memoryview(bytes(frames_per_buffer * self._bytes_per_frame))
 
         self._stream: Optional[sd.RawOutputStream] = None
-        self._buf = bytearray()
-        self._lock = threading.Lock()
+        # Lock-free SPSC ring: write() only advances _w, the audio callback only advances _r.
+        # Both are monotonic byte counters; the GIL makes each int store atomic.
+        ring_size = 1 << (self.RING_BLOCKS * frames_per_buffer * self._bytes_per_frame - 1).bit_length()
+        self._ring = memoryview(bytearray(ring_size))
+        self._mask = ring_size - 1
+        self._r = 0
+        self._w = 0
+        self._overflow_count = 0
         self._running = False
         self._stop_event = threading.Event()
         self._device = self._find_device_by_name(device_name_substr)
@@ -51,21 +63,28 @@ class VBCablePlayer:
 
         def callback(outdata, frames, time_info, status):
             # outdata: memoryview / buffer to be filled with raw bytes
-            requested_bytes = frames * self.channels * np.dtype(self.dtype).itemsize
-            with self._lock:
-                if len(self._buf) >= requested_bytes:
-                    # Enough data: copy and remove
-                    outdata[:] = bytes(self._buf[:requested_bytes])
-                    del self._buf[:requested_bytes]
+            requested_bytes = frames * self._bytes_per_frame
+            out = memoryview(outdata).cast("B")
+            ring = self._ring
+            r = self._r
+            filled = min(self._w - r, requested_bytes)
+            if filled:
+                pos = r & self._mask
+                first = min(filled, len(ring) - pos)
+                out[:first] = ring[pos:pos + first]
+                if first < filled:
+                    # wrapped around the end of the ring
+                    out[first:filled] = ring[:filled - first]
+                self._r = r + filled
+
+            if filled < requested_bytes:
+                # Underflow: rest zeros
+                missing = requested_bytes - filled
+                if missing <= len(self._silence):
+                    out[filled:requested_bytes] = self._silence[:missing]
                 else:
-                    # Underflow: fill what we have then zeros
-                    have = len(self._buf)
-                    if have > 0:
-                        outdata[:have] = bytes(self._buf)
-                        del self._buf[:have]
-                    # rest zeros
-                    outdata[have:requested_bytes] = b'\x00' * (requested_bytes - have)
-                    self._underflow_count += 1
+                    out[filled:requested_bytes] = bytes(missing)
+                self._underflow_count += 1
 
         try:
             self._stream = sd.RawOutputStream(
@@ -83,14 +102,32 @@ class VBCablePlayer:
             logger.error("[VBCABLE PLAYER ERROR - START] %s", e)
             raise RuntimeError(f"Cannot start VBCablePlayer stream (device '{self.device_name_substr}'): {e}")
 
-    def write(self, pcm_bytes: bytes):
+    def write(self, pcm_bytes):
         """
         Add raw PCM (int16, interleaved) to interial buffer.
+        Accepts any C-contiguous bytes-like object (bytes, memoryview, ndarray); the data is copied
+        before returning, so the caller may reuse its buffer.
         """
         if not pcm_bytes:
             return
-        with self._lock:
-            self._buf.extend(pcm_bytes)
+        data = memoryview(pcm_bytes).cast("B")
+        ring = self._ring
+        w = self._w
+        n = len(data)
+        free = len(ring) - (w - self._r)
+        if n > free:
+            # consumer is behind by more than the ring holds: drop the excess instead of growing latency
+            self._overflow_count += 1
+            n = free
+            if not n:
+                return
+        pos = w & self._mask
+        first = min(n, len(ring) - pos)
+        ring[pos:pos + first] = data[:first]
+        if first < n:
+            ring[:n - first] = data[first:n]
+        # publish only after the bytes are in place
+        self._w = w + n
 
     def stop(self):
         if not self._running:
@@ -110,8 +147,8 @@ class VBCablePlayer:
                     pass
         finally:
             self._stream = None
-            with self._lock:
-                self._buf.clear()
+            # discard unread audio; consumer-side move, so it cannot race write()
+            self._r = self._w
             self._running = False
 
     def is_running(self) -> bool:
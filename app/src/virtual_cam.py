@@ -1,15 +1,23 @@
 #virtual_cam.py
-import threading, queue, time, numpy as np
+import threading, time, numpy as np
 import pyvirtualcam
 from pyvirtualcam import PixelFormat
 import logging
 logger = logging.getLogger(__name__)
 
 class VirtualCamera:
+    """
+    Feeds frames to a pyvirtualcam device. send_frame takes I420 (yuv420p) arrays of shape
+    (height * 3 // 2, width), the decoder's native layout, so frames are passed through unconverted.
+    """
+
     def __init__(self, device: str | None = None):
         self.device = device
         self._thread = None
-        self._q = queue.Queue(maxsize=4)
+        # single-slot mailbox: the cam thread only ever wants the newest frame
+        self._latest: np.ndarray | None = None
+        self._frame_lock = threading.Lock()
+        self._frame_evt = threading.Event()
         self._running = threading.Event()
         self._width = None
         self._height = None
@@ -26,38 +34,46 @@ class VirtualCamera:
 
     def stop(self):
         self._running.clear()
-        try:
-            while not self._q.empty(): self._q.get_nowait()
-        except Exception: pass
+        with self._frame_lock:
+            self._latest = None
+            self._frame_evt.clear()
         if self._thread: self._thread.join(timeout=1)
         self._thread = None
 
-    def send_frame(self, bgr_frame: np.ndarray):
+    def is_active(self) -> bool:
+        # False once the device thread has exited, e.g. when the camera could not be opened
+        return bool(self._thread and self._thread.is_alive())
+
+    def send_frame(self, yuv_frame: np.ndarray):
         if not self._running.is_set(): return
-        try: self._q.put_nowait(bgr_frame)
-        except queue.Full:
-            try: _ = self._q.get_nowait(); self._q.put_nowait(bgr_frame)
-            except Exception: pass
+        # planes can't be resized as one image; a frame of another size is dropped
+        if yuv_frame.shape!=(self._height*3//2,self._width): return
+        yuv_frame = np.ascontiguousarray(yuv_frame)
+        with self._frame_lock:
+            self._latest = yuv_frame
+            self._frame_evt.set()
 
     def _run(self):
         try:
-            with pyvirtualcam.Camera(width=self._width, height=self._height, fps=self._fps, device=self.device, fmt=PixelFormat.RGB) as cam:
+            with pyvirtualcam.Camera(width=self._width, height=self._height, fps=self._fps, device=self.device, fmt=PixelFormat.I420) as cam:
                 frame_period = 1.0 / max(1,self._fps)
                 last_send = 0.0
+                # allocated once per session; limited-range black is Y=16, U=V=128
+                silent_yuv = np.full((self._height*3//2,self._width),128,dtype=np.uint8)
+                silent_yuv[:self._height] = 16
                 while self._running.is_set():
-                    try: frame = self._q.get(timeout=0.2)
-                    except Exception:
+                    if not self._frame_evt.wait(0.2):
                         now = time.time()
                         if now - last_send >= frame_period:
-                            black = np.zeros((self._height,self._width,3),dtype=np.uint8)
-                            cam.send(black[:,:,::-1])
+                            cam.send(silent_yuv)
                             cam.sleep_until_next_frame()
                             last_send = now
                         continue
+                    with self._frame_lock:
+                        frame, self._latest = self._latest, None
+                        self._frame_evt.clear()
                     if frame is None: continue
-                    if frame.shape[0]!=self._height or frame.shape[1]!=self._width:
-                        import cv2; frame = cv2.resize(frame,(self._width,self._height))
-                    cam.send(frame[:,:,::-1])
+                    cam.send(frame)
                     cam.sleep_until_next_frame()
                     last_send = time.time()
         except Exception as e:
@@ -1,70 +1,124 @@
 # webrtc_receiver.py
 import asyncio
+import concurrent.futures
+import math
 import threading
-import traceback
+import time
 import numpy as np
 import cv2
-import os
 from typing import Callable, Optional, Dict, Any
-from aiortc import RTCPeerConnection, RTCSessionDescription, RTCIceServer, RTCConfiguration
-from aiortc.contrib.media import MediaBlackhole
-from dotenv import load_dotenv
+from aiortc import RTCPeerConnection, RTCSessionDescription, RTCIceServer, RTCConfiguration, RTCIceCandidate
+from aiortc.sdp import candidate_from_sdp
+from av.video.reformatter import VideoReformatter
 
 from virtual_cam import VirtualCamera
 from vbcable_player import VBCablePlayer
+from config import API_HOST, TURN_PORT, TURN_USERNAME, TURN_PASSWORD, STUN_URL
 import logging
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
-API_HOST = os.getenv("PUBLIC_IP")
-API_PORT = os.getenv("SPRING_PORT")
-FRONTEND_PORT = os.getenv("FRONTEND_PORT")
-TURN_PORT = os.getenv("TURN_PORT")
-TURN_USERNAME = os.getenv("TURN_USERNAME")
-TURN_PASSWORD = os.getenv("TURN_PASSWORD")
-STUN_URL = os.getenv("STUN_URL")
-
 
 class WebRTCReceiver:
     """
     Minimal WebRTC receiver.
     - Video -> virtual camera + preview
+      Frames stay in the decoder's native I420 (yuv420p) layout, scaled to TARGET_HEIGHT by swscale.
+      The same array goes to the virtual camera as-is; only the preview converts to BGR, when open
     - Audio -> compute RMS for UI slider (audio_level)
     - Audio -> optionally forward to VB-Cable (CABLE Input) in realtime
     """
 
+    # ICE servers come from the environment, which does not change at runtime: built once, shared by every connection
+    RTC_CONFIGURATION = RTCConfiguration(
+        iceServers=[
+            RTCIceServer(
+                urls=[f"turn:{API_HOST}:{TURN_PORT}?transport=udp"],
+                username=TURN_USERNAME,
+                credential=TURN_PASSWORD),
+            RTCIceServer(
+                urls=[f"turn:{API_HOST}:{TURN_PORT}?transport=tcp"],
+                username=TURN_USERNAME,
+                credential=TURN_PASSWORD),
+            RTCIceServer(
+                urls=[STUN_URL])
+        ]
+    )
+
+    # trickled ICE candidates are collected for this long and added in one batch
+    CANDIDATE_BATCH_DELAY = 0.01
+    # candidates arriving before the offer are buffered up to this many
+    MAX_PENDING_CANDIDATES = 64
+    # decoded frames are scaled to this height
+    TARGET_HEIGHT = 720
+    # with no new frame the preview only pumps its window this often (seconds)
+    PREVIEW_IDLE_TIMEOUT = 0.1
+    # upper bound on preview redraws; frames published in between are skipped (latest wins)
+    PREVIEW_MAX_FPS = 30
+    # no decoded video frame for this long (seconds) counts as a stall and requests a keyframe
+    KEYFRAME_REQUEST_GAP = 0.5
+    # while requests go unanswered (sender paused/idle) the gap doubles up to this; the next frame resets it
+    KEYFRAME_REQUEST_MAX_GAP = 8.0
+    # an error repeated on a per-frame/per-message path is logged at most once per this many seconds
+    ERROR_LOG_INTERVAL = 1.0
+    # audio_level is recomputed every Nth audio frame (20 ms Opus frames -> ~17 Hz, plenty for the meter)
+    AUDIO_LEVEL_EVERY = 3
+
     def __init__(self, on_stream_start: Callable[[], None],
                  on_stream_stop: Callable[[], None],
                  virtual_cam_device: Optional[str] = None,
                  vbc_device_name: str = "CABLE Input",
-                 vbc_enabled: bool = True):
+                 vbc_enabled: bool = True,
+                 low_latency: bool = False):
         self.on_stream_start = on_stream_start
         self.on_stream_stop = on_stream_stop
+        self._low_latency = low_latency
+        self._error_log_at: Dict[str, float] = {}
 
         self._loop = asyncio.new_event_loop()
+        # decode/convert/resize runs here so the aiortc loop stays free for RTP/RTCP
+        self._frame_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
         self._pc: Optional[RTCPeerConnection] = None
-        self._pending_candidates: list[Dict[str, Any]] = []
-
-        self.latest_frame: Optional[np.ndarray] = None
-        self._frame_lock = threading.Lock()
+        self._pending_candidates: list[RTCIceCandidate] = []
+        self._candidate_batch: list[RTCIceCandidate] = []
+        self._candidate_lock = threading.Lock()
+        self._candidate_flush_scheduled = False
+
+        # lock-free handoff to the preview; the reference swap is atomic under the GIL.
+        # Each frame is a fresh array that is never written after it is published,
+        # so the preview displays it without a copy and can't see a torn frame.
+        self._latest_frame: Optional[np.ndarray] = None
+        self._frame_event = threading.Event()
+        # shown by the preview until the first frame arrives; drawn once, reused
+        self._placeholder = np.zeros((360, 640, 3), dtype=np.uint8)
+        cv2.putText(self._placeholder, "No frame...", (20, 180),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+        # (h, w) of the last decoded frame and the target size/swscale interpolation derived from it
+        self._resize_src: Optional[tuple[int, int]] = None
+        self._resize_dst: Optional[tuple[int, int]] = None
+        self._resize_interp = "BILINEAR"
+        # PyAV builds a reformatter (and swscale context) per frame unless one is reused;
+        # a fresh one per video track
+        self._reformatter = VideoReformatter()
 
         self._preview_thread: Optional[threading.Thread] = None
         self._preview_running = threading.Event()
 
         self.has_stream = False
-        self._audio_sink = MediaBlackhole()
 
         # Virtual camera
         self._virtual_cam = VirtualCamera(device=virtual_cam_device)
         self._virtual_cam_started = False
+        # (width, height) the camera device was opened with
+        self._virtual_cam_size: Optional[tuple[int, int]] = None
         self._virtual_fps = 30
 
         # audio level for slider (0..1)
         self.audio_level = 0.0
+        # int16 output of the audio sample conversion, reused across frames (grown on demand)
+        self._audio_i16_buf = np.empty(960 * 2, dtype=np.int16)
 
         # VB-Cable player (forwards to "CABLE Input")
         # You can disable forwarding by setting vbc_enabled=False
@@ -91,6 +145,23 @@ class WebRTCReceiver:
         self._run_coro(self._handle_offer(offer, send_answer_callback))
 
     async def _handle_offer(self, offer: dict, send_answer_callback: Callable[[dict], None]):
+        try:
+            desc = RTCSessionDescription(
+                sdp=offer.get("sdp", ""),
+                type=offer.get("type", "offer")
+            )
+        except Exception as e:
+            logger.error("[WEBRTC RECEIVER - HANDLE OFER]: %s", e)
+            return
+
+        # renegotiation keeps DTLS/SRTP state and TURN allocations instead of a full re-handshake
+        if self._can_renegotiate(desc):
+            try:
+                await self._answer(self._pc, desc, send_answer_callback)
+                return
+            except Exception as e:
+                logger.error("[WEBRTC RECIEVER - RENEGOTIATE]: %s", e)
+
         if self._pc:
             try:
                 await self._pc.close()
@@ -99,22 +170,7 @@ class WebRTCReceiver:
                 pass
             self._pc = None
 
-        pc = RTCPeerConnection(
-            RTCConfiguration(
-                iceServers=[
-                    RTCIceServer(
-                        urls=[f"turn:{API_HOST}:{TURN_PORT}?transport=udp"],
-                        username=TURN_USERNAME,
-                        credential=TURN_PASSWORD),
-                    RTCIceServer(
-                        urls=[f"turn:{API_HOST}:{TURN_PORT}?transport=tcp"],
-                        username=TURN_USERNAME,
-                        credential=TURN_PASSWORD),
-                    RTCIceServer(
-                        urls=[STUN_URL])
-                ]
-            )
-        )
+        pc = RTCPeerConnection(self.RTC_CONFIGURATION)
 
         self._pc = pc
 
@@ -136,51 +192,88 @@ class WebRTCReceiver:
                 asyncio.ensure_future(self._recv_audio(track), loop=self._loop)
 
         try:
-            desc = RTCSessionDescription(
-                sdp=offer.get("sdp", ""),
-                type=offer.get("type", "offer")
-            )
-            await pc.setRemoteDescription(desc)
+            await self._answer(pc, desc, send_answer_callback)
+        except Exception as e:
+            logger.error("[WEBRTC RECEIVER - HANDLE OFER]: %s", e)
+            logger.debug("[WEBRTC RECEIVER - HANDLE OFER]", exc_info=True)
 
-            for cand in self._pending_candidates:
-                try:
-                    await pc.addIceCandidate(cand)
-                except Exception as e:
-                    pass
-            self._pending_candidates.clear()
+    async def _answer(self, pc: RTCPeerConnection, desc: RTCSessionDescription,
+                      send_answer_callback: Callable[[dict], None]):
+        await pc.setRemoteDescription(desc)
+        if self._low_latency:
+            self._disable_jitter_prefetch(pc)
 
-            answer = await pc.createAnswer()
-            await pc.setLocalDescription(answer)
+        pending, self._pending_candidates = self._pending_candidates, []
+        if pending:
+            await asyncio.gather(*(pc.addIceCandidate(c) for c in pending), return_exceptions=True)
 
-            answer_obj = {
-                "type": pc.localDescription.type,
-                "sdp": pc.localDescription.sdp
-            }
-            send_answer_callback(answer_obj)
+        answer = await pc.createAnswer()
+        await pc.setLocalDescription(answer)
 
-        except Exception as e:
-            logger.error("[WEBRTC RECEIVER - HANDLE OFER]: %s", e)
-            traceback.print_exc()
+        answer_obj = {
+            "type": pc.localDescription.type,
+            "sdp": pc.localDescription.sdp
+        }
+        send_answer_callback(answer_obj)
 
-    async def _recv_video(self, track):
+    def _can_renegotiate(self, desc: RTCSessionDescription) -> bool:
+        """
+        An offer from the same remote peer (same DTLS fingerprint) on a live connection is a renegotiation
+        or ICE restart and can reuse it. The browser creates a new RTCPeerConnection per stream, so a
+        fresh stream has a new fingerprint and gets a new connection.
+        """
+        pc = self._pc
+        if pc is None or pc.connectionState != "connected" or pc.remoteDescription is None:
+            return False
+        fingerprint = self._sdp_fingerprint(desc.sdp)
+        return fingerprint is not None and fingerprint == self._sdp_fingerprint(pc.remoteDescription.sdp)
+
+    @staticmethod
+    def _sdp_fingerprint(sdp: str) -> Optional[str]:
+        for line in sdp.splitlines():
+            if line.startswith("a=fingerprint:"):
+                return line
+        return None
+
+    @staticmethod
+    def _disable_jitter_prefetch(pc: RTCPeerConnection):
+        """
+        Trades jitter robustness for latency: receivers release packets as soon as they can
+        instead of first buffering `prefetch` of them. Relies on aiortc internals, so it is a no-op
+        if the jitter buffer attribute is not there.
+        """
+        for receiver in pc.getReceivers():
+            jitter_buffer = getattr(receiver, "_RTCRtpReceiver__jitter_buffer", None)
+            if jitter_buffer is not None and hasattr(jitter_buffer, "_prefetch"):
+                jitter_buffer._prefetch = 0
 
+    async def _recv_video(self, track):
+        self._reformatter = VideoReformatter()
+        self._last_frame_at = time.monotonic()
+        watchdog = asyncio.ensure_future(self._keyframe_watchdog(track), loop=self._loop)
         try:
             while True:
                 frame = await track.recv()
-                img = frame.to_ndarray(format="bgr24")
+                self._last_frame_at = time.monotonic()
+
+                # nobody to show the frame to (camera device gone, preview closed): skip the conversion
+                if (self._virtual_cam_started and not self._virtual_cam.is_active()
+                        and not self._preview_running.is_set()):
+                    continue
 
-                target_h = 720
-                h, w = img.shape[:2]
-                scale = target_h / h
-                new_w = int(w * scale)
-                img = cv2.resize(img, (new_w, target_h))
+                img = await self._loop.run_in_executor(self._frame_executor, self._convert_frame, frame)
 
-                with self._frame_lock:
-                    self.latest_frame = img
+                size = self._resize_dst
+                if self._virtual_cam_started and size != self._virtual_cam_size:
+                    # aspect changed mid-track (e.g. a resized shared window): the device can't take
+                    # frames of another size, so reopen it; the join runs off the event loop
+                    await self._loop.run_in_executor(self._frame_executor, self.stop_virtual_camera)
 
                 if not self._virtual_cam_started:
-                    self._virtual_cam.start(width=new_w, height=target_h, fps=self._virtual_fps)
+                    width, height = size
+                    self._virtual_cam.start(width=width, height=height, fps=self._virtual_fps)
                     self._virtual_cam_started = True
+                    self._virtual_cam_size = size
 
                 self._virtual_cam.send_frame(img)
 
@@ -188,8 +281,66 @@ class WebRTCReceiver:
             logger.error("[WEBRTC RECIEVER - VIDEO]: %s", e)
             pass
         finally:
+            watchdog.cancel()
             self._cleanup_after_stream_stop()
 
+    async def _keyframe_watchdog(self, track):
+        """
+        Sends an RTCP PLI whenever no frame has arrived for KEYFRAME_REQUEST_GAP, so video stalled by
+        packet loss recovers within an RTT instead of at the sender's next scheduled keyframe.
+        Repeated unanswered requests back off to KEYFRAME_REQUEST_MAX_GAP.
+        aiortc has no public PLI API; this relies on RTCRtpReceiver internals and does nothing without them.
+        """
+        gap = self.KEYFRAME_REQUEST_GAP
+        requested_at = 0.0
+        while True:
+            await asyncio.sleep(self.KEYFRAME_REQUEST_GAP)
+            now = time.monotonic()
+            if now - self._last_frame_at < self.KEYFRAME_REQUEST_GAP:
+                continue
+            if self._last_frame_at > requested_at:
+                # video flowed since the last request: a fresh stall, ask right away
+                gap = self.KEYFRAME_REQUEST_GAP
+            elif now - requested_at < gap:
+                continue
+            requested_at = now
+            gap = min(gap * 2, self.KEYFRAME_REQUEST_MAX_GAP)
+
+            pc = self._pc
+            receiver = next((r for r in pc.getReceivers() if r.track is track), None) if pc else None
+            send_pli = getattr(receiver, "_send_rtcp_pli", None)
+            if send_pli is None:
+                continue
+            for ssrc in list(getattr(receiver, "_RTCRtpReceiver__remote_streams", ())):
+                try:
+                    await send_pli(ssrc)
+                except Exception as e:
+                    logger.error("[WEBRTC RECIEVER - KEYFRAME REQUEST]: %s", e)
+
+    def _convert_frame(self, frame) -> np.ndarray:
+        """
+        Runs on the frame executor: converts to I420 at TARGET_HEIGHT and publishes it to the preview.
+        The result is (height * 3 // 2, width): Y plane followed by the U and V planes.
+        """
+        src = (frame.height, frame.width)
+        if src != self._resize_src:
+            h, w = src
+            self._resize_src = src
+            # I420 chroma is subsampled 2x2, so the width must be even
+            self._resize_dst = (int(w * self.TARGET_HEIGHT / h) & ~1, self.TARGET_HEIGHT)
+            # area averaging for downscale (no aliasing), bilinear for upscale
+            self._resize_interp = "AREA" if h > self.TARGET_HEIGHT else "BILINEAR"
+        new_w, target_h = self._resize_dst
+
+        # one swscale pass does both the scaling and the format; a yuv420p frame already
+        # at target size is only copied out of the decoder
+        img = self._reformatter.reformat(frame, format="yuv420p", width=new_w, height=target_h,
+                                         interpolation=self._resize_interp).to_ndarray()
+
+        self._latest_frame = img
+        self._frame_event.set()
+        return img
+
     async def _recv_audio(self, track):
         """
         Receives audio frames from WebRTC:
@@ -199,6 +350,9 @@ class WebRTCReceiver:
         """
         first_frames_logged = False
         frame_count_for_log = 0
+        level_countdown = 0
+        convert = None
+        convert_signature = None
 
         # Start VB-Cable
         if self._vbc_enabled and self._vbc_player is not None:
@@ -230,52 +384,39 @@ class WebRTCReceiver:
 
                 # Konwersja do int16 / interleaved
                 try:
-                    s = np.asarray(arr)
-
-                    # planar: (channels, frames) → (frames, channels)
-                    if s.ndim == 2 and s.shape[0] in (1, 2, 4) and s.shape[0] <= s.shape[1]:
-                        s = s.T
-
-                    # flatten jeśli 1-kanałowy
-                    if s.ndim == 1:
-                        s = s.reshape(-1, 1)
+                    # the layout/dtype checks run only when the decoded format changes
+                    signature = (arr.dtype, arr.shape)
+                    if signature != convert_signature:
+                        convert = self._build_audio_converter(arr)
+                        convert_signature = signature
 
-                    # float → int16
-                    if s.dtype.kind == 'f':
-                        s = np.clip(s, -1.0, 1.0)
-                        s = (s * 32767.0).astype(np.int16)
-                    else:
-                        if s.dtype != np.int16:
-                            max_val = np.iinfo(s.dtype).max
-                            s = (s.astype(np.float32) / max_val * 32767.0).astype(np.int16)
-
-                    interleaved = s.reshape(-1).tobytes()
+                    s16 = convert(arr)
 
                 except Exception as e:
-                    logger.error("[AUDIO] Conversion failed: %s", e)
-                    interleaved = arr.astype(np.int16).reshape(-1).tobytes()
+                    self._log_error_limited("[AUDIO] Conversion failed: %s", e)
+                    s16 = arr.astype(np.int16).reshape(-1)
 
                 # Wysyłanie do VB-Cable
                 if self._vbc_enabled and self._vbc_player is not None:
                     try:
-                        self._vbc_player.write(interleaved)
+                        # write() copies into its ring right away, so a view of the samples is enough
+                        self._vbc_player.write(memoryview(s16))
                     except Exception as e:
-                        logger.error("[VBCABLE] Write error: %s", e)
+                        self._log_error_limited("[VBCABLE] Write error: %s", e)
 
-                # RMS
+                # RMS (straight from the int16 samples, no round trip through bytes)
+                if level_countdown:
+                    level_countdown -= 1
+                    continue
+                level_countdown = self.AUDIO_LEVEL_EVERY - 1
                 try:
-                    s16 = np.frombuffer(interleaved, dtype=np.int16)
-                    if s16.size % 2 == 0:
-                        s16 = s16.reshape(-1, 2)
-                    else:
-                        s16 = s16.reshape(-1, 1)
-
-                    f = s16.astype(np.float32) / 32768.0
-                    rms = np.sqrt(np.mean(f * f))
+                    # exact int64 sum of squares in one dot product, no float temporaries
+                    wide = s16.astype(np.int64)
+                    rms = math.sqrt(int(np.dot(wide, wide)) / wide.size) / 32768.0 if wide.size else 0.0
 
                     self.audio_level = max(0.0, min(1.0, rms * 4.2))
                 except Exception as e:
-                    logger.error("[AUDIO] RMS: %s", e)
+                    self._log_error_limited("[AUDIO] RMS: %s", e)
                     self.audio_level = 0.0
 
         except Exception as e:
@@ -293,6 +434,57 @@ class WebRTCReceiver:
             self.audio_level = 0.0
             self._cleanup_after_stream_stop()
 
+    def _build_audio_converter(self, sample: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Returns a function turning decoded audio shaped like `sample` into flat interleaved int16,
+        specialized for its layout (planar/interleaved) and dtype (int16/float/other int).
+        """
+        # planar: (channels, frames) → (frames, channels)
+        planar = sample.ndim == 2 and sample.shape[0] in (1, 2, 4) and sample.shape[0] <= sample.shape[1]
+
+        if sample.dtype == np.int16:
+            if planar:
+                return lambda s: s.T.reshape(-1)
+            return lambda s: s.reshape(-1)
+
+        # float → int16
+        if sample.dtype.kind == 'f':
+            # decoded frames are owned by us, so clip in place when the array allows it
+            in_place = sample.flags.writeable
+
+            def scaled(s):
+                clipped = np.clip(s, -1.0, 1.0, out=s if in_place else None)
+                return np.multiply(clipped, 32767.0, out=self._audio_i16(s.shape), casting="unsafe")
+        else:
+            factor = 32767.0 / np.iinfo(sample.dtype).max
+
+            def scaled(s):
+                return np.multiply(s, factor, out=self._audio_i16(s.shape), casting="unsafe")
+
+        if planar:
+            return lambda s: scaled(s.T).reshape(-1)
+        return lambda s: scaled(s).reshape(-1)
+
+    def _audio_i16(self, shape) -> np.ndarray:
+        """
+        Returns a view of the reusable int16 conversion buffer with the given shape.
+        """
+        size = int(np.prod(shape))
+        if size > self._audio_i16_buf.size:
+            self._audio_i16_buf = np.empty(size, dtype=np.int16)
+        return self._audio_i16_buf[:size].reshape(shape)
+
+    def _log_error_limited(self, msg: str, *args):
+        """
+        logger.error for paths that can fail on every frame/message: the same message is logged at most
+        once per ERROR_LOG_INTERVAL instead of flooding the log from the event loop.
+        """
+        now = time.monotonic()
+        last = self._error_log_at.get(msg)
+        if last is None or now - last >= self.ERROR_LOG_INTERVAL:
+            self._error_log_at[msg] = now
+            logger.error(msg, *args)
+
     def _cleanup_after_stream_stop(self):
         if self.has_stream:
             self.has_stream = False
@@ -309,17 +501,67 @@ class WebRTCReceiver:
         if not candidate or "candidate" not in candidate:
             return
 
+        parsed = self._parse_candidate(candidate)
+
         if not self._pc:
-            self._pending_candidates.append(candidate)
+            if parsed is not None and len(self._pending_candidates) < self.MAX_PENDING_CANDIDATES:
+                self._pending_candidates.append(parsed)
             return
 
+        with self._candidate_lock:
+            if parsed is not None:
+                self._candidate_batch.append(parsed)
+            if self._candidate_flush_scheduled:
+                return
+            self._candidate_flush_scheduled = True
+
+        # empty candidate = end of gathering, nothing more to wait for
+        delay = self.CANDIDATE_BATCH_DELAY if parsed is not None else 0
         try:
-            asyncio.run_coroutine_threadsafe(
-                self._pc.addIceCandidate(candidate), self._loop
-            )
+            self._run_coro(self._flush_candidates(delay))
         except Exception as e:
+            with self._candidate_lock:
+                self._candidate_flush_scheduled = False
             logger.error("[WEBRTC RECIEVER - ADD CANDIDATE]: %s", e)
-            traceback.print_exc()
+            logger.debug("[WEBRTC RECIEVER - ADD CANDIDATE]", exc_info=True)
+
+    def _parse_candidate(self, candidate: Dict[str, Any]) -> Optional[RTCIceCandidate]:
+        """
+        Turns the browser's RTCIceCandidate JSON into an aiortc RTCIceCandidate on the caller's thread,
+        so the event loop only applies it. Returns None for the empty end-of-candidates entry or a malformed one.
+        """
+        sdp = candidate.get("candidate") or ""
+        if sdp.startswith("candidate:"):
+            sdp = sdp[len("candidate:"):]
+        if not sdp:
+            return None
+
+        try:
+            parsed = candidate_from_sdp(sdp)
+        except Exception as e:
+            self._log_error_limited("[WEBRTC RECIEVER - PARSE CANDIDATE]: %s", e)
+            return None
+
+        parsed.sdpMid = candidate.get("sdpMid")
+        parsed.sdpMLineIndex = candidate.get("sdpMLineIndex")
+        return parsed
+
+    async def _flush_candidates(self, delay: float):
+        if delay:
+            await asyncio.sleep(delay)
+
+        with self._candidate_lock:
+            batch, self._candidate_batch = self._candidate_batch, []
+            self._candidate_flush_scheduled = False
+
+        pc = self._pc
+        if pc is None or not batch:
+            return
+
+        results = await asyncio.gather(*(pc.addIceCandidate(c) for c in batch), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("[WEBRTC RECIEVER - ADD CANDIDATE]: %s", result)
 
     def start_preview(self):
         if self._preview_thread and self._preview_thread.is_alive():
@@ -346,6 +588,7 @@ class WebRTCReceiver:
 
     def _preview_loop(self):
         cv2.namedWindow("Stream Preview", cv2.WINDOW_NORMAL)
+        next_draw = 0.0
 
         while self._preview_running.is_set():
 
@@ -358,16 +601,22 @@ class WebRTCReceiver:
                 self._preview_running.clear()
                 break
 
-            with self._frame_lock:
-                frame = None if self.latest_frame is None else self.latest_frame.copy()
+            # sleep until the receiver publishes a frame instead of spinning on waitKey
+            new_frame = self._frame_event.wait(self.PREVIEW_IDLE_TIMEOUT)
+            if new_frame:
+                # wait out the rest of the frame period; newer frames replace the published one meanwhile
+                delay = next_draw - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            self._frame_event.clear()
+
+            frame = self._latest_frame
 
             if frame is None:
-                black = np.zeros((360, 640, 3), dtype=np.uint8)
-                cv2.putText(black, "No frame...", (20, 180),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
-                cv2.imshow("Stream Preview", black)
-            else:
-                cv2.imshow("Stream Preview", frame)
+                cv2.imshow("Stream Preview", self._placeholder)
+            elif new_frame:
+                cv2.imshow("Stream Preview", cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_I420))
+                next_draw = time.monotonic() + 1.0 / self.PREVIEW_MAX_FPS
 
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 self._preview_running.clear()
@@ -387,14 +636,21 @@ class WebRTCReceiver:
             logger.error("[WEBRTC RECIEVER - STOP VIRTUAL CAMERA]: %s", e)
             pass
         self._virtual_cam_started = False
+        self._virtual_cam_size = None
 
-    def stop_stream(self):
+    def stop_stream(self, await_close: bool = False):
+        """
+        Tears the stream down. The peer connection is closed on the event loop in the background,
+        so UI callers don't wait on DTLS/ICE teardown; await_close waits for it (up to 2 s).
+        """
         self.stop_preview()
         self.stop_virtual_camera()
 
         if self._pc:
             try:
-                asyncio.run_coroutine_threadsafe(self._pc.close(), self._loop).result(timeout=2)
+                future = self._run_coro(self._pc.close())
+                if await_close:
+                    future.result(timeout=2)
             except Exception as e:
                 logger.error("[WEBRTC RECIEVER - STOP STREAM]: %s", e)
                 pass
@@ -408,7 +664,7 @@ class WebRTCReceiver:
                 logger.error("[WEBRTC RECIEVER - STOP STREAM]: %s", e)
                 pass
 
-        self.latest_frame = None
+        self._latest_frame = None
 
         if self.has_stream:
             self.has_stream = False
@@ -420,7 +676,8 @@ class WebRTCReceiver:
 
     def close(self):
         try:
-            self.stop_stream()
+            # the loop is stopped right after, so the close has to finish first
+            self.stop_stream(await_close=True)
         except Exception:
             pass
 
@@ -433,6 +690,8 @@ class WebRTCReceiver:
             logger.error("[WEBRTC RECIEVER - CLOSE]: %s", e)
             pass
 
+        self._frame_executor.shutdown(wait=False)
+
         if self._thread and self._thread.is_alive():
             try:
                 self._thread.join(timeout=2)
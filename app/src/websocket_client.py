@@ -1,8 +1,8 @@
 # websocket_client.py
+import queue
+import socket
 import ssl
 import threading
-import time
-import traceback
 from typing import Callable, Optional
 import logging
 logger = logging.getLogger(__name__)
@@ -17,19 +17,53 @@ class WebSocketClient:
     Lightweight WebSocket client using websocket-client.WebSocketApp.
     - Pass cookie header from AuthClient.get_cookie_header()
     - on_status: callable(status_str)
-    - on_message: callable(message_str)
+    - on_message: callable(message_bytes) - text frames are passed on as raw UTF-8 bytes
+      (UTF-8 validation is skipped; the JSON parser decodes and validates them itself)
+    - Keepalive uses native WebSocket ping frames (no JSON round-trip); ping_interval/ping_timeout tune it
+    - send() only enqueues; a sender thread drains the queue in bursts
+    - ssl_context: optional pre-built context (e.g. AuthClient.ssl_context), used as-is
     """
 
-    def __init__(self, url: str, cookie_header: str, on_message: Callable[[str], None], on_status: Optional[Callable[[str], None]] = None, verify_tls: bool = True):
+    # keepalive defaults; a dead path (e.g. expired NAT mapping) is noticed within interval + timeout
+    PING_INTERVAL = 20
+    PING_TIMEOUT = 10
+    SOCKOPT = ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)
+    # most messages written per sender wakeup
+    MAX_BATCH = 64
+    # how long disconnect() waits for the sender to flush, and for the reader after closing
+    CLOSE_JOIN_TIMEOUT = 0.5
+
+    def __init__(self, url: str, cookie_header: str, on_message: Callable[[bytes], None], on_status: Optional[Callable[[str], None]] = None, verify_tls: bool = True, ssl_context: Optional[ssl.SSLContext] = None, ping_interval: float = PING_INTERVAL, ping_timeout: float = PING_TIMEOUT):
         self.url = url
         self.cookie_header = cookie_header
         self.on_message = on_message
         self.on_status = on_status or (lambda s: None)
         self.verify_tls = verify_tls
-
+        # run_forever rejects this too, but only later on the reader thread
+        if ping_interval and ping_timeout and ping_timeout >= ping_interval:
+            raise ValueError("ping_timeout must be shorter than ping_interval")
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+
+        # built once per client; MainWindow creates a new client (fresh cookie) for each connection
+        self._headers = [f"Cookie: {cookie_header}"] if cookie_header else []
+        # one TLS context for every (re)connect; websocket-client would otherwise build a new one each time
+        if ssl_context is None:
+            if verify_tls:
+                ssl_context = ssl.create_default_context()
+            else:
+                ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+        self._sslopt = {"context": ssl_context}
         self._ws_app = None
         self._thread = None
         self._closed = threading.Event()
+        # plain flag for send(); maintained by the open/close/error callbacks
+        self._is_connected = False
+
+        self._out_q: queue.Queue[Optional[str]] = queue.Queue()
+        self._sender: Optional[threading.Thread] = None
 
     def _log_status(self, msg: str):
         try:
@@ -39,6 +73,7 @@ class WebSocketClient:
             pass
 
     def _on_open(self, ws):
+        self._is_connected = True
         self._log_status("CONNECTED")
 
     def _on_message(self, ws, message):
@@ -46,12 +81,14 @@ class WebSocketClient:
             self.on_message(message)
         except Exception as e:
             logger.error("[WEBSOCKET CLIENT ERROR - ON MESSAGE] %s", e)
-            traceback.print_exc()
+            logger.debug("[WEBSOCKET CLIENT ERROR - ON MESSAGE]", exc_info=True)
 
     def _on_close(self, ws, close_status_code, close_msg):
+        self._is_connected = False
         self._log_status(f"CLOSED ({close_status_code})")
 
     def _on_error(self, ws, error):
+        self._is_connected = False
         self._log_status(f"ERROR: {error}")
 
     def connect(self):
@@ -59,54 +96,113 @@ class WebSocketClient:
             self._log_status("ALREADY CONNECTED")
             return
 
-        headers = []
-        if self.cookie_header:
-            headers.append(f"Cookie: {self.cookie_header}")
-
-        self._ws_app = websocket.WebSocketApp(
+        ws_app = self._ws_app = websocket.WebSocketApp(
             self.url,
-            header=headers,
+            header=self._headers,
             on_open=self._on_open,
             on_message=self._on_message,
             on_close=self._on_close,
             on_error=self._on_error,
         )
 
+        # per-connection outbound queue; its sender exits together with the reader below
+        out_q = self._out_q = queue.Queue()
+
         def run():
             self._closed.clear()
-            # sslopt: by default None -> system cert verification
-            sslopt = {}
-            if not self.verify_tls:
-                sslopt = {"cert_reqs": ssl.CERT_NONE}
             try:
                 # run_forever blocks until closed
-                self._ws_app.run_forever(sslopt=sslopt)
+                ws_app.run_forever(
+                    sslopt=self._sslopt,
+                    sockopt=self.SOCKOPT,
+                    ping_interval=self.ping_interval,
+                    ping_timeout=self.ping_timeout,
+                    # skips the pure-Python UTF-8 scan and the decode; on_message gets the raw bytes
+                    skip_utf8_validation=True
+                )
             except Exception as e:
                 self._log_status(f"RUN ERROR: {e}")
             finally:
+                self._is_connected = False
                 self._closed.set()
+                # a server-side close/error never reaches disconnect(); stop this connection's sender here
+                out_q.put(None)
+
+        # reported before the thread starts, so it can't arrive after CONNECTED
+        self._log_status("CONNECTING")
 
         self._thread = threading.Thread(target=run, daemon=True)
         self._thread.start()
 
-        # Wait small time for connection attempt to settle
-        time.sleep(0.1)
-        self._log_status("CONNECTING")
+        self._sender = threading.Thread(target=self._send_loop, args=(ws_app, out_q), daemon=True)
+        self._sender.start()
 
     def disconnect(self):
+        self._is_connected = False
+        # stop sender first so it flushes what is already queued while the socket is still open
+        if self._sender and self._sender.is_alive():
+            self._out_q.put(None)
+            self._sender.join(timeout=self.CLOSE_JOIN_TIMEOUT)
         if self._ws_app:
             try:
-                self._ws_app.close()
+                # the sender has written its last burst and uncorked by now, so the close frame
+                # isn't held back; don't wait for the server's echo, the socket is shut down
+                # right away, which also wakes the reader out of select()
+                self._ws_app.close(timeout=0)
             except Exception as e:
                 logger.error("[WEBSOCKET CLIENT ERROR - DISCONNECT] %s", e)
                 pass
-        # wait a little for clean close
+        # the reader exits as soon as its socket is gone; this only covers callback work in flight
         if self._thread:
-            self._thread.join(timeout=2)
+            self._thread.join(timeout=self.CLOSE_JOIN_TIMEOUT)
+        self._sender = None
         self._log_status("DISCONNECTED")
 
     def send(self, text: str):
-        if self._ws_app and self._ws_app.sock and self._ws_app.sock.connected:
-            self._ws_app.send(text)
+        if self._is_connected:
+            self._out_q.put(text)
         else:
             raise RuntimeError("WebSocket is not connected")
+
+    def _send_loop(self, ws_app, out_q: queue.Queue):
+        """
+        Blocks for the first outbound message, then drains whatever else is
+        already queued and writes the whole burst in one wakeup. Runs until None is queued.
+        """
+        while True:
+            batch = [out_q.get()]
+            try:
+                while len(batch) < self.MAX_BATCH:
+                    batch.append(out_q.get_nowait())
+            except queue.Empty:
+                pass
+
+            # cork a multi-message burst so its frames go out in as few segments as possible
+            sock = self._raw_socket(ws_app) if len(batch) > 1 else None
+            self._set_cork(sock, 1)
+            try:
+                for text in batch:
+                    if text is None:
+                        return
+                    try:
+                        ws_app.send(text)
+                    except Exception as e:
+                        logger.error("[WEBSOCKET CLIENT ERROR - SEND] %s", e)
+            finally:
+                self._set_cork(sock, 0)
+
+    @staticmethod
+    def _raw_socket(ws_app):
+        return getattr(ws_app.sock, "sock", None)
+
+    @staticmethod
+    def _set_cork(sock, on: int):
+        """
+        TCP_CORK holds partial segments until uncorked (Linux only; elsewhere TCP_NODELAY alone applies).
+        """
+        if sock is None or not hasattr(socket, "TCP_CORK"):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, on)
+        except OSError:
+            pass
@@ -79,19 +79,19 @@ public class AuthenticationController {
      * Authenticates a user and returns access and refresh tokens.
      *
      * @param request the login request with username and password
-     * @return {@link ResponseEntity} with the access and refresh tokens
+     * @return {@link ResponseEntity} with the authenticated user's info ({@link UserResponse}); access and refresh tokens are set as cookies
      * @throws AuthenticationException if authentication fails
      * @since 1.0
      */
     @Operation(summary = "Authenticates a user and returns access and refresh tokens")
     @ApiResponses({
-            @ApiResponse(responseCode = "200", description = "User authenticated successfully", content = @Content),
+            @ApiResponse(responseCode = "200", description = "User authenticated successfully", content = @Content(schema = @Schema(implementation = UserResponse.class))),
             @ApiResponse(responseCode = "400", description = "Invalid request data", content = @Content(schema = @Schema(implementation = Map.class))),
             @ApiResponse(responseCode = "401", description = "Invalid username or password", content = @Content(schema = @Schema(implementation = Map.class))),
             @ApiResponse(responseCode = "500", description = "Server error", content = @Content(schema = @Schema(implementation = Map.class)))
     })
     @PostMapping("/login")
-    public ResponseEntity<Void> login(@Valid @RequestBody LoginRequest request, HttpServletResponse response) {
+    public ResponseEntity<UserResponse> login(@Valid @RequestBody LoginRequest request, HttpServletResponse response) {
         log.info("Authenticating user: {}", request.username());
         Authentication authentication = authenticationManager.authenticate(
                 new UsernamePasswordAuthenticationToken(request.username(), request.password()));
@@ -103,7 +103,7 @@ public class AuthenticationController {
         cookieComponent.addCookie(response, "refreshToken", refreshToken.getToken(), jwtProperties.getRefreshExpirationDays() * 86400000L);
 
         log.info("User authenticated successfully: {}", request.username());
-        return ResponseEntity.ok().build();
+        return ResponseEntity.ok(new UserResponse(user.getUsername(), user.getRoles(), user.getCreatedAt()));
     }
 
     /**
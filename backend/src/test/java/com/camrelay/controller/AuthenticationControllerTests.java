@@ -190,7 +190,7 @@ class AuthenticationControllerTests {
     class LoginTests {
         /**
          * Tests successful user login and cookie creation.
-         * Ensures that accessToken and refreshToken cookies are set.
+         * Ensures that accessToken and refreshToken cookies are set and the user info is returned.
          * @since 1.0
          */
         @Test
@@ -213,7 +213,9 @@ class AuthenticationControllerTests {
                     .andExpect(header().exists("Set-Cookie"))
                     .andExpect(header().stringValues("Set-Cookie", hasItem(containsString("accessToken=" + TEST_TOKEN))))
                     .andExpect(header().stringValues("Set-Cookie", hasItem(containsString("refreshToken=" + TEST_REFRESH_TOKEN))))
-                    .andExpect(content().string(""));
+                    .andExpect(jsonPath("$.username").value(TEST_USERNAME))
+                    .andExpect(jsonPath("$.roles", hasSize(1)))
+                    .andExpect(jsonPath("$.roles[0]").value("USER"));
 
             // Verify
             verify(authenticationManager).authenticate(any(UsernamePasswordAuthenticationToken.class));